@@ -1,3 +1,4 @@
 from .client import Client
+from .async_client import AsyncClient
 from .framework.message import Message
 from .utils.tools import Tools
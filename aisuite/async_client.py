@@ -0,0 +1,92 @@
+import asyncio
+from typing import Literal
+
+from .client import Client
+
+
+class AsyncClient:
+    """Awaitable facade over `Client`.
+
+    Providers with a native `achat_completions_create` are awaited directly;
+    other requests run the synchronous provider call in a worker thread via
+    `asyncio.to_thread`. Either way independent requests can be awaited
+    concurrently (e.g. with `asyncio.gather`) without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        provider_configs: dict = {},
+        extra_param_mode: Literal["strict", "warn", "permissive"] = "warn",
+    ):
+        """
+        Initialize the async client. Arguments are the same as for `Client`.
+        """
+        self.client = Client(provider_configs, extra_param_mode)
+        self._chat = None
+
+    @property
+    def chat(self):
+        """Return the async chat API interface."""
+        if not self._chat:
+            self._chat = AsyncChat(self.client)
+        return self._chat
+
+    async def aclose(self):
+        """Close async HTTP clients opened by providers on the current loop."""
+        for provider in self.client.providers.values():
+            aclose = getattr(provider, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+class AsyncChat:
+    def __init__(self, client: Client):
+        self.client = client
+        self._completions = AsyncCompletions(self.client)
+
+    @property
+    def completions(self):
+        """Return the async completions interface."""
+        return self._completions
+
+
+class AsyncCompletions:
+    def __init__(self, client: Client):
+        self.client = client
+
+    async def create(self, model: str, messages: list, **kwargs):
+        """
+        Create chat completion without blocking the event loop.
+
+        Accepts the same arguments as `Client.chat.completions.create`. With
+        `stream=True` an async iterator of chunks is returned.
+
+        Providers that implement `achat_completions_create` are awaited
+        directly and decide how to honor their own configuration (e.g.
+        google_rest only uses its async pool with the `rest` transport);
+        others run in a worker thread.
+        """
+        completions = self.client.chat.completions
+        if "max_turns" not in kwargs and not kwargs.get("stream"):
+            provider, model_name = completions._get_provider(model)
+            acreate = getattr(provider, "achat_completions_create", None)
+            if acreate is not None:
+                response = await acreate(model_name, messages, **kwargs)
+                return completions._extract_thinking_content(response)
+
+        response = await asyncio.to_thread(
+            completions.create, model, messages, **kwargs
+        )
+        if kwargs.get("stream"):
+            return _iterate_in_thread(response)
+        return response
+
+
+async def _iterate_in_thread(iterator):
+    """Yield from a blocking iterator, advancing it in a worker thread."""
+    done = object()
+    while True:
+        item = await asyncio.to_thread(next, iterator, done)
+        if item is done:
+            return
+        yield item
@@ -215,10 +215,10 @@ class Completions:
         response.choices[0].intermediate_messages = intermediate_messages
         return response
 
-    def create(self, model: str, messages: list, **kwargs):
+    def _get_provider(self, model: str):
         """
-        Create chat completion based on the model, messages, and any extra arguments.
-        Supports automatic tool execution when max_turns is specified.
+        Resolve a 'provider:model' string to its provider instance and model name,
+        initializing the provider on first use.
         """
         # Check that correct format is used
         if ":" not in model:
@@ -248,6 +248,15 @@ class Completions:
         if not provider:
             raise ValueError(f"Could not load provider for '{provider_key}'.")
 
+        return provider, model_name
+
+    def create(self, model: str, messages: list, **kwargs):
+        """
+        Create chat completion based on the model, messages, and any extra arguments.
+        Supports automatic tool execution when max_turns is specified.
+        """
+        provider, model_name = self._get_provider(model)
+
         # Extract tool-related parameters
         max_turns = kwargs.pop("max_turns", None)
         tools = kwargs.get("tools", None)
@@ -89,6 +89,29 @@ class CompletionUsage(BaseModel):
     """Breakdown of tokens used in the prompt."""
 
 
+class ChoiceDelta(BaseModel):
+    """Represents the incremental message content of a streamed chunk."""
+
+    content: Optional[str] = None
+    role: Optional[Literal["assistant"]] = None
+    tool_calls: Optional[List[ChatCompletionMessageToolCall]] = None
+
+
+class ChunkChoice(BaseModel):
+    """Represents a single choice within a streamed chunk."""
+
+    index: int = 0
+    delta: ChoiceDelta
+    finish_reason: Optional[Literal["stop", "tool_calls"]] = None
+
+
+class ChatCompletionChunk(BaseModel):
+    """Represents a single chunk of a streamed chat completion."""
+
+    choices: List[ChunkChoice]
+    usage: Optional[CompletionUsage] = None
+
+
 class Word(BaseModel):
     """Represents a single word with timing information."""
 
@@ -2,10 +2,49 @@
 
 import os
 import json
-from typing import List, Dict, Any, Optional, Union, BinaryIO, AsyncGenerator
+import asyncio
+import concurrent.futures
+import copy
+import hashlib
+import importlib.util
+import itertools
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import (
+    List,
+    Dict,
+    Any,
+    Optional,
+    Union,
+    BinaryIO,
+    AsyncGenerator,
+    Iterator,
+)
+
+import httpx
+import requests
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder.
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # fastjsonschema is optional; tool args are then unchecked.
+    fastjsonschema = None
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from aisuite.framework import ChatCompletionResponse, Message
 from aisuite.framework.message import (
+    ChatCompletionChunk,
+    ChoiceDelta,
+    ChunkChoice,
+    CompletionUsage,
     TranscriptionResult,
     Word,
     Segment,
@@ -18,6 +57,237 @@ from aisuite.provider import Provider, ASRError, Audio
 DEFAULT_TEMPERATURE = 0.7
 ENABLE_DEBUG_MESSAGES = False
 
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+
+# Connection pool settings for the REST transport. Keeping sockets alive
+# across calls avoids paying a fresh TCP + TLS handshake per request.
+DEFAULT_TIMEOUT = 30
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+# generateContent is not idempotent: only retry failed connects and throttling
+# or server-error statuses, never a request that may already have run.
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_FORCELIST = [429, 500, 502, 503, 504]
+
+# Async client settings. HTTP/2 lets concurrent requests share a single
+# multiplexed connection, but httpx only supports it when `h2` is installed.
+ASYNC_MAX_CONNECTIONS = 32
+ASYNC_MAX_KEEPALIVE_CONNECTIONS = 16
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _genai_available() -> bool:
+    """Return True if google-generativeai can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec("google.generativeai") is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# Upper bound on threads used by chat_completions_create_many.
+MAX_FANOUT_WORKERS = 8
+
+# Micro-batching is opt-in: set `batch_window_ms` in the provider config.
+DEFAULT_MAX_BATCH = 16
+
+# Requests below this temperature (and without tools) are treated as
+# deterministic and served from an in-process LRU cache on repeat.
+DEFAULT_CACHE_SIZE = 512
+CACHE_MAX_TEMPERATURE = 0.05
+
+# Server-side context caching (REST transport only, opt-in via the
+# `context_cache` config flag). Long shared prefixes are uploaded once to the
+# `cachedContents` endpoint and referenced by name on later turns.
+DEFAULT_CONTEXT_CACHE_TTL = 300
+DEFAULT_CONTEXT_CACHE_MIN_TOKENS = 4096
+CONTEXT_CACHE_MAX_ENTRIES = 32
+CONTEXT_CACHE_EXPIRY_MARGIN = 10
+CHARS_PER_TOKEN = 4
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Translated tool declarations kept per provider (tool schemas are static).
+TOOLS_CACHE_SIZE = 32
+
+# Compiled argument validators kept per provider, keyed by parameter schema.
+VALIDATORS_CACHE_SIZE = 128
+
+# Parsed arguments of recently emitted tool calls, keyed by their JSON string.
+TOOL_ARGS_CACHE_SIZE = 256
+
+
+# Tool call ids only need to be unique within the process; a counter is cheap
+# and, unlike hash(name), distinguishes repeated calls to the same function.
+_CALL_COUNTER = itertools.count()
+
+
+def _next_call_id() -> str:
+    return f"call_{next(_CALL_COUNTER):08x}"
+
+
+# JSON Schema keywords outside the OpenAPI subset Gemini accepts.
+UNSUPPORTED_SCHEMA_KEYS = frozenset(
+    ["additionalProperties", "$schema", "$id", "$defs", "definitions"]
+)
+
+
+def _gemini_schema(schema) -> Dict[str, Any]:
+    """Copy a JSON schema, recursively dropping keywords Gemini rejects."""
+    result = {}
+    for key, value in schema.items():
+        if key in UNSUPPORTED_SCHEMA_KEYS:
+            continue
+        if key == "properties":
+            value = {name: _gemini_schema(prop) for name, prop in value.items()}
+        elif key == "items" and isinstance(value, dict):
+            value = _gemini_schema(value)
+        elif key == "anyOf":
+            value = [_gemini_schema(option) for option in value]
+        result[key] = value
+    return result
+
+
+def _translate_tool(tool) -> Dict[str, Any]:
+    """Translate one OpenAI-style tool into a Gemini function declaration.
+
+    Property schemas are passed through (including `items`, nested objects
+    and `format`), so only keywords Gemini does not support are removed.
+    """
+    function = tool["function"]
+    parameters = function.get("parameters", {})
+    properties = {}
+    for param_name, param_info in parameters.get("properties", {}).items():
+        param_schema = _gemini_schema(param_info)
+        if "type" not in param_schema and "anyOf" not in param_schema:
+            param_schema["type"] = "string"
+        param_schema.setdefault("description", "")
+        properties[param_name] = param_schema
+    return {
+        "name": function["name"],
+        "description": function.get("description", ""),
+        "parameters": {
+            "type": "object",
+            "properties": properties,
+            "required": parameters.get("required", []),
+        },
+    }
+
+
+def _validate_tool_args(validator, name, args):
+    """Check model-produced tool arguments against the tool's JSON schema."""
+    try:
+        validator(args)
+    except fastjsonschema.JsonSchemaException as e:
+        raise ValueError(f"Invalid arguments for tool '{name}': {e.message}")
+
+
+def _as_dict(message) -> Dict[str, Any]:
+    """Return a message as a dict, only dumping pydantic `Message` objects.
+
+    Callers mostly pass plain dicts, so check for that first instead of
+    probing every message for `model_dump`.
+    """
+    if isinstance(message, dict):
+        return message
+    return message.model_dump()
+
+
+def _json_default(obj):
+    """Serialize pydantic models (e.g. `Message`) met inside a payload."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj, sort_keys=False) -> bytes:
+    """Serialize a payload to bytes, using orjson when available.
+
+    Pydantic objects are handled by the `default` hook, so callers can pass
+    raw message lists without dumping each message first.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_json_default, option=option)
+    return json.dumps(
+        obj, separators=(",", ":"), sort_keys=sort_keys, default=_json_default
+    ).encode()
+
+
+def _json_loads(data: bytes):
+    """Parse a response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _estimate_tokens(system_instruction, contents, limit=None) -> int:
+    """Roughly estimate the token count of a prompt from its text length.
+
+    When `limit` is given, counting stops as soon as the estimate reaches it,
+    so gating a long conversation does not walk every remaining part.
+    """
+    max_chars = None if limit is None else limit * CHARS_PER_TOKEN
+    parts = system_instruction["parts"] if system_instruction else ()
+    chars = 0
+    for part in itertools.chain(
+        parts, itertools.chain.from_iterable(c["parts"] for c in contents)
+    ):
+        chars += len(part.get("text", ""))
+        if max_chars is not None and chars >= max_chars:
+            break
+    return chars // CHARS_PER_TOKEN
+
+
+def _genai_chunk_text(chunk) -> Optional[str]:
+    """Return the text of a genai stream chunk, or None if it carries none.
+
+    `chunk.text` raises for function-call, safety-blocked or empty chunks, so
+    read the parts of the first candidate instead.
+    """
+    if not chunk.candidates:
+        return None
+    text = "".join(part.text for part in chunk.candidates[0].content.parts)
+    return text or None
+
+
+@dataclass(slots=True)
+class _BuilderState:
+    """Mutable state threaded through the per-role handlers of convert_request."""
+
+    contents: list = field(default_factory=list)
+    system_instruction: Optional[str] = None
+
+
+# Per-role handlers for the genai converter. Each one appends a message to
+# the builder `state` so convert_request can dispatch with one dict lookup.
+# Transcript pieces are collected in a list and joined once at the end.
+def _genai_system(message, state):
+    # System messages become system instruction
+    state.system_instruction = message.get("content", "")
+
+
+def _genai_user(message, state):
+    state.contents.append(f"User: {message.get('content', '')}")
+
+
+def _genai_assistant(message, state):
+    state.contents.append(f"Assistant: {message.get('content', '')}")
+
+
+def _genai_tool(message, state):
+    state.contents.append(f"Tool Response: {message.get('content', '')}")
+
+
+_GENAI_ROLE_HANDLERS = {
+    "system": _genai_system,
+    "user": _genai_user,
+    "assistant": _genai_assistant,
+    "tool": _genai_tool,
+}
+
 
 class GoogleRestMessageConverter:
     """Convert messages between aisuite format and Google Gemini genai format."""
@@ -29,36 +299,16 @@ class GoogleRestMessageConverter:
         Returns:
             tuple: (contents, system_instruction)
         """
-        # Convert all messages to dicts if they're Message objects
-        messages = [
-            message.model_dump() if hasattr(message, "model_dump") else message
-            for message in messages
-        ]
+        # Convert Message objects to dicts; plain dicts are used as-is
+        messages = [_as_dict(message) for message in messages]
 
-        contents = ""
-        system_instruction = None
-        
+        state = _BuilderState()
         for message in messages:
-            role = message["role"]
-            content = message.get("content", "")
-            
-            if role == "system":
-                # System messages become system instruction
-                system_instruction = content
-            elif role == "user":
-                # User messages
-                if contents:
-                    contents += f"\n\nUser: {content}"
-                else:
-                    contents = f"User: {content}"
-            elif role == "assistant":
-                # Assistant messages
-                contents += f"\n\nAssistant: {content}"
-            elif role == "tool":
-                # Tool responses
-                contents += f"\n\nTool Response: {content}"
-
-        return contents, system_instruction
+            handler = _GENAI_ROLE_HANDLERS.get(message["role"])
+            if handler is not None:
+                handler(message, state)
+
+        return "\n\n".join(state.contents), state.system_instruction
 
     @staticmethod
     def convert_response(response) -> ChatCompletionResponse:
@@ -95,10 +345,12 @@ class GoogleRestMessageConverter:
                                 function_call = part.function_call
                                 function_calls = [{
                                     "type": "function",
-                                    "id": f"call_{hash(function_call.name)}",
+                                    "id": _next_call_id(),
                                     "function": {
                                         "name": function_call.name,
-                                        "arguments": json.dumps(dict(function_call.args))
+                                        "arguments": _encode_tool_args(
+                                            dict(function_call.args)
+                                        ),
                                     }
                                 }]
                                 
@@ -152,11 +404,556 @@ class GoogleRestMessageConverter:
         return aisuite_response
 
 
+# Per-role handlers for the REST converter.
+def _rest_system(message, state):
+    state.system_instruction = message.get("content", "")
+
+
+def _rest_user(message, state):
+    state.contents.append(
+        {"role": "user", "parts": [{"text": message.get("content", "")}]}
+    )
+
+
+_EMITTED_TOOL_ARGS: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_EMITTED_TOOL_ARGS_LOCK = threading.Lock()
+
+
+def _encode_tool_args(args) -> str:
+    """Encode tool-call arguments, remembering the dict for when it is replayed.
+
+    `Function.arguments` stays a JSON string for OpenAI compatibility; keeping
+    the parsed dict lets the next request skip decoding it again.
+    """
+    arguments = _json_dumps(args).decode()
+    with _EMITTED_TOOL_ARGS_LOCK:
+        _EMITTED_TOOL_ARGS[arguments] = args
+        _EMITTED_TOOL_ARGS.move_to_end(arguments)
+        while len(_EMITTED_TOOL_ARGS) > TOOL_ARGS_CACHE_SIZE:
+            _EMITTED_TOOL_ARGS.popitem(last=False)
+    return arguments
+
+
+def _tool_args(arguments: str) -> Dict[str, Any]:
+    """Return tool-call arguments as a dict, reusing ones we emitted."""
+    with _EMITTED_TOOL_ARGS_LOCK:
+        args = _EMITTED_TOOL_ARGS.get(arguments)
+    if args is None:
+        args = json.loads(arguments)
+    return args
+
+
+def _rest_assistant(message, state):
+    if message.get("tool_calls"):
+        parts = [
+            {
+                "functionCall": {
+                    "name": tool_call["function"]["name"],
+                    "args": _tool_args(tool_call["function"]["arguments"]),
+                }
+            }
+            for tool_call in message["tool_calls"]
+        ]
+    else:
+        parts = [{"text": message.get("content") or ""}]
+    state.contents.append({"role": "model", "parts": parts})
+
+
+def _rest_tool(message, state):
+    try:
+        response = json.loads(message.get("content", ""))
+    except (TypeError, json.JSONDecodeError):
+        response = message.get("content", "")
+    if not isinstance(response, dict):
+        response = {"result": response}
+    state.contents.append(
+        {
+            "role": "user",
+            "parts": [
+                {
+                    "functionResponse": {
+                        "name": message.get("name"),
+                        "response": response,
+                    }
+                }
+            ],
+        }
+    )
+
+
+_REST_ROLE_HANDLERS = {
+    "system": _rest_system,
+    "user": _rest_user,
+    "assistant": _rest_assistant,
+    "tool": _rest_tool,
+}
+
+
+class GeminiRestMessageConverter:
+    """Convert messages between aisuite format and the Gemini REST JSON format."""
+
+    @staticmethod
+    def convert_request(
+        messages: List[Dict[str, Any]],
+    ) -> tuple[List[Dict[str, Any]], Optional[str]]:
+        """Convert aisuite messages to Gemini REST `contents`.
+
+        Returns:
+            tuple: (contents, system_instruction)
+        """
+        # Convert Message objects to dicts; plain dicts are used as-is
+        messages = [_as_dict(message) for message in messages]
+
+        state = _BuilderState()
+        for message in messages:
+            handler = _REST_ROLE_HANDLERS.get(message["role"])
+            if handler is not None:
+                handler(message, state)
+
+        return state.contents, state.system_instruction
+
+    @staticmethod
+    def convert_response(
+        response_data: Dict[str, Any], validators: Optional[Dict[str, Any]] = None
+    ) -> ChatCompletionResponse:
+        """Convert a Gemini REST `generateContent` response to aisuite format.
+
+        `validators` optionally maps tool names to compiled argument validators.
+        """
+        aisuite_response = ChatCompletionResponse()
+
+        if ENABLE_DEBUG_MESSAGES:
+            print("Dumping the response")
+            print(f"Response: {response_data}")
+
+        text_parts, tool_calls, _ = GeminiRestMessageConverter._extract_candidate(
+            response_data, validators
+        )
+
+        if tool_calls:
+            aisuite_response.choices[0].message = Message(
+                role="assistant", content=None, tool_calls=tool_calls
+            )
+            aisuite_response.choices[0].finish_reason = "tool_calls"
+        else:
+            aisuite_response.choices[0].message = Message(
+                role="assistant", content="".join(text_parts)
+            )
+            aisuite_response.choices[0].finish_reason = "stop"
+
+        aisuite_response.usage = GeminiRestMessageConverter._convert_usage(
+            response_data
+        )
+
+        return aisuite_response
+
+    @staticmethod
+    def convert_stream_chunk(
+        response_data: Dict[str, Any], validators: Optional[Dict[str, Any]] = None
+    ) -> ChatCompletionChunk:
+        """Convert one `streamGenerateContent` SSE event to a chat completion chunk."""
+        text_parts, tool_calls, finish_reason = (
+            GeminiRestMessageConverter._extract_candidate(response_data, validators)
+        )
+
+        if tool_calls:
+            finish_reason = "tool_calls"
+        elif finish_reason is not None:
+            finish_reason = "stop"
+
+        return ChatCompletionChunk(
+            choices=[
+                ChunkChoice(
+                    delta=ChoiceDelta(
+                        role="assistant",
+                        content="".join(text_parts) if text_parts else None,
+                        tool_calls=tool_calls or None,
+                    ),
+                    finish_reason=finish_reason,
+                )
+            ],
+            usage=GeminiRestMessageConverter._convert_usage(response_data),
+        )
+
+    @staticmethod
+    def _extract_candidate(
+        response_data: Dict[str, Any], validators: Optional[Dict[str, Any]] = None
+    ):
+        """Split the first candidate into (text parts, tool calls, finish reason)."""
+        candidates = response_data.get("candidates") or [{}]
+        candidate = candidates[0]
+        parts = candidate.get("content", {}).get("parts", [])
+
+        text_parts = []
+        tool_calls = []
+        for part in parts:
+            if "functionCall" in part:
+                function_call = part["functionCall"]
+                if validators and function_call["name"] in validators:
+                    _validate_tool_args(
+                        validators[function_call["name"]],
+                        function_call["name"],
+                        function_call.get("args", {}),
+                    )
+                tool_calls.append(
+                    {
+                        "type": "function",
+                        "id": _next_call_id(),
+                        "function": {
+                            "name": function_call["name"],
+                            "arguments": _encode_tool_args(
+                                function_call.get("args", {})
+                            ),
+                        },
+                    }
+                )
+            elif "text" in part:
+                text_parts.append(part["text"])
+
+        return text_parts, tool_calls, candidate.get("finishReason")
+
+    @staticmethod
+    def _convert_usage(response_data: Dict[str, Any]) -> Optional[CompletionUsage]:
+        usage = response_data.get("usageMetadata")
+        if not usage:
+            return None
+        return CompletionUsage(
+            prompt_tokens=usage.get("promptTokenCount"),
+            completion_tokens=usage.get("candidatesTokenCount"),
+            total_tokens=usage.get("totalTokenCount"),
+        )
+
+
+class _ResponseCache:
+    """A small thread-safe LRU cache of converted chat completion responses."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, ChatCompletionResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def put(self, key, response):
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+class _ContextCache:
+    """Track Gemini `cachedContents` created for long conversation prefixes.
+
+    Entries are keyed by a hash of (model, system instruction, contents[:n])
+    and kept in LRU order. Expired entries are dropped locally; evicted ones
+    are also deleted on the server on a best-effort basis.
+    """
+
+    def __init__(self, session, api_key, timeout, ttl, min_tokens):
+        self._session = session
+        self._api_key = api_key
+        self._timeout = timeout
+        self._ttl = ttl
+        self._min_tokens = min_tokens
+        self._prefix_cache: "OrderedDict[bytes, tuple[str, float]]" = OrderedDict()
+        # Creates in flight, so concurrent callers share one billed entry.
+        self._pending: Dict[bytes, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def apply(self, model, request_data):
+        """Replace a cached (or cacheable) prefix of `contents` with `cachedContent`."""
+        # Tools and the system instruction must live in the cache itself when a
+        # cachedContent is referenced; keep it simple and skip tool requests.
+        contents = request_data["contents"]
+        if "tools" in request_data or len(contents) < 2:
+            return
+
+        system_instruction = request_data.get("systemInstruction")
+        prefix_keys = self._prefix_keys(model, system_instruction, contents)
+
+        name, prefix_len = self._lookup(prefix_keys)
+        if name is None:
+            prefix_len = len(contents) - 1
+            prefix = contents[:prefix_len]
+            estimate = _estimate_tokens(
+                system_instruction, prefix, limit=self._min_tokens
+            )
+            if estimate < self._min_tokens:
+                return
+            name = self._create_once(
+                prefix_keys[prefix_len - 1], model, system_instruction, prefix
+            )
+            if name is None:
+                return
+
+        request_data["cachedContent"] = name
+        request_data["contents"] = contents[prefix_len:]
+        request_data.pop("systemInstruction", None)
+
+    @staticmethod
+    def _prefix_keys(model, system_instruction, contents) -> List[bytes]:
+        """Return one digest per prefix length 1..len(contents) - 1."""
+        hasher = hashlib.blake2b(model.encode())
+        hasher.update(_json_dumps(system_instruction, sort_keys=True))
+        keys = []
+        for content in contents[:-1]:
+            hasher.update(_json_dumps(content, sort_keys=True))
+            keys.append(hasher.digest())
+        return keys
+
+    def _lookup(self, prefix_keys):
+        """Find the longest live cached prefix, dropping expired entries."""
+        now = time.monotonic()
+        with self._lock:
+            for prefix_len in range(len(prefix_keys), 0, -1):
+                key = prefix_keys[prefix_len - 1]
+                entry = self._prefix_cache.get(key)
+                if entry is None:
+                    continue
+                name, expires_at = entry
+                if expires_at <= now:
+                    del self._prefix_cache[key]
+                    continue
+                self._prefix_cache.move_to_end(key)
+                return name, prefix_len
+        return None, 0
+
+    def _store(self, key, name):
+        expires_at = time.monotonic() + self._ttl - CONTEXT_CACHE_EXPIRY_MARGIN
+        with self._lock:
+            self._prefix_cache[key] = (name, expires_at)
+            evicted = []
+            while len(self._prefix_cache) > CONTEXT_CACHE_MAX_ENTRIES:
+                evicted.append(self._prefix_cache.popitem(last=False)[1][0])
+        for evicted_name in evicted:
+            self._delete(evicted_name)
+
+    def _create_once(self, key, model, system_instruction, prefix) -> Optional[str]:
+        """Create and store a cachedContent for `key`, unless one is in flight.
+
+        A caller that finds another create for the same prefix in progress
+        waits for it and reuses its result instead of creating a duplicate.
+        """
+        with self._lock:
+            entry = self._prefix_cache.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                return entry[0]
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = threading.Event()
+
+        if pending is not None:
+            pending.wait(self._timeout)
+            with self._lock:
+                entry = self._prefix_cache.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                return None
+            return entry[0]
+
+        name = None
+        try:
+            name = self._create(model, system_instruction, prefix)
+            if name is not None:
+                self._store(key, name)
+        finally:
+            with self._lock:
+                done = self._pending.pop(key)
+            done.set()
+        return name
+
+    def _create(self, model, system_instruction, prefix) -> Optional[str]:
+        body = {
+            "model": f"models/{model}",
+            "contents": prefix,
+            "ttl": f"{self._ttl}s",
+        }
+        if system_instruction:
+            body["systemInstruction"] = system_instruction
+        try:
+            response = self._session.post(
+                f"{GEMINI_API_BASE}/cachedContents",
+                data=_json_dumps(body),
+                headers=JSON_HEADERS,
+                params={"key": self._api_key},
+                timeout=self._timeout,
+            )
+            response.raise_for_status()
+            return _json_loads(response.content)["name"]
+        except (requests.RequestException, ValueError, KeyError) as e:
+            # Caching is an optimization; fall back to sending the full history.
+            if ENABLE_DEBUG_MESSAGES:
+                print(f"Failed to create cached content: {e}")
+            return None
+
+    def _delete(self, name):
+        try:
+            self._session.delete(
+                f"{GEMINI_API_BASE}/{name}",
+                params={"key": self._api_key},
+                timeout=self._timeout,
+            )
+        except requests.RequestException:
+            pass
+
+
+class _MicroBatcher:
+    """Coalesce concurrent synchronous calls into batches.
+
+    Requests submitted from any thread are queued on a private event loop
+    running in a daemon thread. Everything arriving within `window_ms` of
+    the first queued request (up to `max_batch` requests) is dispatched
+    together with `asyncio.gather` over one shared async client.
+
+    `send` is a bound method of the provider; it is held weakly so the
+    background thread does not keep the provider alive. The provider stops
+    the batcher when it is closed or collected.
+    """
+
+    def __init__(self, send, client_factory, window_ms, max_batch):
+        self._send = weakref.WeakMethod(send)
+        self._client_factory = client_factory
+        self._window = window_ms / 1000
+        self._max_batch = max_batch
+        self._loop = asyncio.new_event_loop()
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._tasks = set()
+        # Guards `_closed` so nothing can be queued behind the stop sentinel.
+        self._closed = False
+        self._close_lock = threading.Lock()
+
+        ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(ready,), name="gemini-micro-batcher", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+
+    def submit(self, model, messages, kwargs):
+        """Queue a request and block until its batch has been dispatched."""
+        future = concurrent.futures.Future()
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit a request to a closed micro-batcher.")
+            self._loop.call_soon_threadsafe(
+                self._batch_queue.put_nowait, (model, messages, kwargs, future)
+            )
+        return future.result()
+
+    def close(self):
+        """Flush in-flight batches and stop the background loop."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._loop.call_soon_threadsafe(self._batch_queue.put_nowait, None)
+            except RuntimeError:
+                return  # The loop has already shut down.
+        if self._thread.is_alive():
+            # The provider may be collected on the batcher thread itself.
+            if threading.current_thread() is not self._thread:
+                self._thread.join()
+
+    def _run(self, ready):
+        asyncio.set_event_loop(self._loop)
+        self._batch_queue = asyncio.Queue()
+        # Build the client while the provider is still constructing us, so no
+        # reference to it outlives __init__.
+        client = self._client_factory()
+        self._client_factory = None
+        ready.set()
+        try:
+            self._loop.run_until_complete(self._drain(client))
+        finally:
+            self._loop.close()
+
+    async def _drain(self, client):
+        closing = False
+        while not closing:
+            item = await self._batch_queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = self._loop.time() + self._window
+            while len(batch) < self._max_batch:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._batch_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+
+            task = self._loop.create_task(self._dispatch(client, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        # Fail anything left behind the sentinel rather than leave it waiting.
+        while not self._batch_queue.empty():
+            item = self._batch_queue.get_nowait()
+            if item is not None:
+                item[3].set_exception(
+                    RuntimeError("The micro-batcher was closed before dispatch.")
+                )
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+        await client.aclose()
+
+    async def _dispatch(self, client, batch):
+        # Callers blocked in submit() keep the provider alive until answered.
+        send = self._send()
+        results = await asyncio.gather(
+            *[
+                send(client, model, messages, **kwargs)
+                for model, messages, kwargs, _ in batch
+            ],
+            return_exceptions=True,
+        )
+        del send
+        for (_, _, _, future), result in zip(batch, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
 class GoogleRestProvider(Provider):
     """Implements the Provider interface for Google's Gemini REST API using genai client."""
 
     def __init__(self, **config):
-        """Initialize the Google REST API client using genai."""
+        """Initialize the Google REST API client.
+
+        The `transport` config option selects how requests are sent:
+        "genai" (default) goes through the google-generativeai client,
+        "rest" posts JSON directly to the Gemini REST endpoint over a
+        pooled keep-alive session.
+        """
         super().__init__()
         
         self.api_key = config.get("api_key") or os.getenv("GOOGLE_API_KEY")
@@ -165,25 +962,120 @@ class GoogleRestProvider(Provider):
                 "GOOGLE_API_KEY is required for Google REST API. "
                 "Set it in environment variables or provider config."
             )
-        
-        # Import and configure genai
-        try:
-            import google.generativeai as genai
-            genai.configure(api_key=self.api_key)
-            self.genai = genai
-        except ImportError:
-            raise ImportError(
-                "google-generativeai is required for Google REST API. "
-                "Install it with: pip install google-generativeai"
+
+        # Prefer the genai client (gRPC) when it is installed; otherwise fall
+        # back to plain HTTPS so the provider works without the SDK.
+        self.transport = config.get(
+            "transport", "genai" if _genai_available() else "rest"
+        )
+        if self.transport not in ("genai", "rest"):
+            raise ValueError(
+                f"Unsupported transport '{self.transport}'. "
+                "Expected 'genai' or 'rest'."
             )
+        self.timeout = config.get("timeout", DEFAULT_TIMEOUT)
+
+        # Reuse one session so repeated calls share pooled TCP/TLS connections.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=Retry(
+                    total=RETRY_TOTAL,
+                    read=0,
+                    other=0,
+                    backoff_factor=RETRY_BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUS_FORCELIST,
+                    allowed_methods=frozenset(["POST"]),
+                    raise_on_status=False,
+                ),
+            ),
+        )
+        # Each cachedContents create is billed, so never retry those calls.
+        self._session.mount(
+            f"{GEMINI_API_BASE}/cachedContents",
+            HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE, max_retries=0),
+        )
+        # Created lazily, since an AsyncClient is bound to the running event
+        # loop; the loop is remembered so a later loop gets its own client.
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._response_cache = _ResponseCache(
+            config.get("cache_size", DEFAULT_CACHE_SIZE)
+        )
+
+        self._context_cache = None
+        if config.get("context_cache"):
+            self._context_cache = _ContextCache(
+                session=self._session,
+                api_key=self.api_key,
+                timeout=self.timeout,
+                ttl=config.get("context_cache_ttl", DEFAULT_CONTEXT_CACHE_TTL),
+                min_tokens=config.get(
+                    "context_cache_min_tokens", DEFAULT_CONTEXT_CACHE_MIN_TOKENS
+                ),
+            )
+
+        # Optionally coalesce concurrent sync calls into batched async dispatches.
+        self._batcher = None
+        if config.get("batch_window_ms") is not None:
+            if self.transport != "rest":
+                raise ValueError(
+                    "batch_window_ms requires transport='rest'; "
+                    "micro-batches are sent over the async REST client."
+                )
+            self._batcher = _MicroBatcher(
+                send=self._arequest,
+                client_factory=self._new_aclient,
+                window_ms=config["batch_window_ms"],
+                max_batch=config.get("max_batch", DEFAULT_MAX_BATCH),
+            )
+        
+        # google-generativeai is heavy to import; defer it to the first genai call
+        self._genai = None
+        
+        # Endpoint URLs and query params are built once, not per request
+        self._url_cache: Dict[tuple, str] = {}
+        self._params = {"key": self.api_key}
+        self._stream_params = {"key": self.api_key, "alt": "sse"}
+
+        self._tools_cache: Dict[int, tuple] = {}
+        self._validators: Dict[bytes, Any] = {}
+        self._model_cache: Dict[str, Any] = {}
+        self._genconfig_cache: Dict[tuple, Any] = {}
         
         self.transformer = GoogleRestMessageConverter()
+        self.rest_transformer = GeminiRestMessageConverter()
         
         # Initialize audio functionality (placeholder for now)
         self.audio = GoogleRestAudio(self)
 
+    def close(self):
+        """Close the pooled HTTP session and stop the micro-batcher."""
+        self._session.close()
+        if self._batcher is not None:
+            self._batcher.close()
+
+    async def aclose(self):
+        """Close the async HTTP client, if one was opened on the running loop."""
+        aclient, self._aclient = self._aclient, None
+        if aclient is not None and self._aclient_loop is asyncio.get_running_loop():
+            await aclient.aclose()
+        self._aclient_loop = None
+
+    def __del__(self):
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+        batcher = getattr(self, "_batcher", None)
+        if batcher is not None:
+            batcher.close()
+
     def chat_completions_create(self, model, messages, **kwargs):
-        """Request chat completions from Google Gemini REST API using genai client.
+        """Request chat completions from Google Gemini REST API.
 
         Args:
         ----
@@ -193,50 +1085,438 @@ class GoogleRestProvider(Provider):
 
         Returns:
         -------
-            The ChatCompletionResponse with the completion result.
+            The ChatCompletionResponse with the completion result, or an
+            iterator of ChatCompletionChunk when `stream=True` is passed.
         """
-        
+        if kwargs.pop("stream", False):
+            return self.chat_completions_stream(model, messages, **kwargs)
+
+        cache_key = self._response_cache_key(model, messages, kwargs)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        if self._batcher is not None:
+            response = self._batcher.submit(model, messages, kwargs)
+        elif self.transport == "rest":
+            response = self._rest_chat_completions_create(model, messages, **kwargs)
+        else:
+            response = self._genai_chat_completions_create(model, messages, **kwargs)
+
+        if cache_key is not None:
+            self._response_cache.put(cache_key, copy.deepcopy(response))
+        return response
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return hit/miss counters for the in-process response cache."""
+        return self._response_cache.stats()
+
+    def _response_cache_key(self, model, messages, kwargs) -> Optional[bytes]:
+        """Hash a near-deterministic request, or return None if it must not be cached."""
+        if self._response_cache.maxsize <= 0 or "tools" in kwargs:
+            return None
+        # temperature=None defers to the server default, which is not deterministic
+        temperature = kwargs.get("temperature", DEFAULT_TEMPERATURE)
+        if temperature is None or temperature >= CACHE_MAX_TEMPERATURE:
+            return None
+
+        # Message objects are serialized by the encoder's default hook
+        canonical = {"model": model, "messages": messages, "kwargs": kwargs}
+        try:
+            return hashlib.blake2b(_json_dumps(canonical, sort_keys=True)).digest()
+        except TypeError:
+            # Arguments without a JSON form cannot be keyed reliably
+            return None
+
+    def _ensure_genai(self):
+        """Import and configure google-generativeai on first use."""
+        if self._genai is None:
+            try:
+                import google.generativeai as genai
+            except ImportError:
+                raise ImportError(
+                    "google-generativeai is required for Google REST API. "
+                    "Install it with: pip install google-generativeai"
+                )
+            genai.configure(api_key=self.api_key, transport="grpc")
+            self._genai = genai
+        return self._genai
+
+    def _prepare_genai_request(self, model, messages, **kwargs):
+        """Return the cached model, flattened contents and generation config."""
+        genai = self._ensure_genai()
+
         # Set the temperature if provided, otherwise use the default
         temperature = kwargs.get("temperature", DEFAULT_TEMPERATURE)
-        
+
         # Convert messages to genai format
         contents, system_instruction = self.transformer.convert_request(messages)
-        
+
         if ENABLE_DEBUG_MESSAGES:
             print("Dumping the request data")
             print(f"Contents: {contents}")
             print(f"System instruction: {system_instruction}")
-        
+
+        # Reuse GenerativeModel instances; construction resolves config each time
+        model_instance = self._model_cache.get(model)
+        if model_instance is None:
+            model_instance = genai.GenerativeModel(model)
+            self._model_cache[model] = model_instance
+
+        # Prepare generation config, reusing one per parameter combination
+        config_key = (
+            temperature,
+            kwargs.get("max_tokens", 8192),
+            kwargs.get("top_p", 0.95),
+            kwargs.get("top_k", 40),
+        )
+        generation_config = self._genconfig_cache.get(config_key)
+        if generation_config is None:
+            generation_config = genai.GenerationConfig(
+                temperature=config_key[0],
+                max_output_tokens=config_key[1],
+                top_p=config_key[2],
+                top_k=config_key[3],
+            )
+            self._genconfig_cache[config_key] = generation_config
+
+        # Note: system_instruction is not supported in the current API
+        # We'll include it in the contents instead
+        if system_instruction:
+            full_contents = f"System: {system_instruction}\n\n{contents}"
+        else:
+            full_contents = contents
+
+        return model_instance, full_contents, generation_config
+
+    def _genai_chat_completions_create(self, model, messages, **kwargs):
+        """Request chat completions through the google-generativeai client."""
         try:
-            # Create GenerativeModel
-            model_instance = self.genai.GenerativeModel(model)
-            
-            # Prepare generation config
-            generation_config = self.genai.GenerationConfig(
-                temperature=temperature,
-                max_output_tokens=kwargs.get("max_tokens", 8192),
-                top_p=kwargs.get("top_p", 0.95),
-                top_k=kwargs.get("top_k", 40)
+            model_instance, full_contents, generation_config = (
+                self._prepare_genai_request(model, messages, **kwargs)
             )
-            
-            # Generate content
-            # Note: system_instruction is not supported in the current API
-            # We'll include it in the contents instead
-            if system_instruction:
-                full_contents = f"System: {system_instruction}\n\n{contents}"
-            else:
-                full_contents = contents
-                
             response = model_instance.generate_content(
-                contents=full_contents,
-                generation_config=generation_config
+                contents=full_contents, generation_config=generation_config
             )
-            
             return self.transformer.convert_response(response)
-            
+        except ImportError:
+            raise
         except Exception as e:
             raise ValueError(f"Failed to call Google Gemini REST API: {e}")
 
+    def _genai_chat_completions_stream(
+        self, model, messages, **kwargs
+    ) -> Iterator[ChatCompletionChunk]:
+        """Stream chat completions over the genai client's gRPC stream."""
+        try:
+            model_instance, full_contents, generation_config = (
+                self._prepare_genai_request(model, messages, **kwargs)
+            )
+            response = model_instance.generate_content(
+                contents=full_contents,
+                generation_config=generation_config,
+                stream=True,
+            )
+            for chunk in response:
+                delta = ChoiceDelta(content=_genai_chunk_text(chunk), role="assistant")
+                yield ChatCompletionChunk(choices=[ChunkChoice(index=0, delta=delta)])
+        except ImportError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to call Google Gemini REST API: {e}")
+
+        yield ChatCompletionChunk(
+            choices=[ChunkChoice(index=0, delta=ChoiceDelta(), finish_reason="stop")]
+        )
+
+    def _build_rest_request(self, messages, **kwargs) -> Dict[str, Any]:
+        """Build the JSON body for a Gemini REST `generateContent` call."""
+        contents, system_instruction = self.rest_transformer.convert_request(messages)
+
+        request_data = {
+            "contents": contents,
+            "generationConfig": {
+                "temperature": kwargs.get("temperature", DEFAULT_TEMPERATURE),
+                "maxOutputTokens": kwargs.get("max_tokens", 8192),
+                "topP": kwargs.get("top_p", 0.95),
+                "topK": kwargs.get("top_k", 40),
+            },
+        }
+        if system_instruction:
+            request_data["systemInstruction"] = {
+                "parts": [{"text": system_instruction}]
+            }
+
+        if "tools" in kwargs:
+            request_data["tools"] = self._translate_tools(kwargs["tools"])
+
+        return request_data
+
+    def _endpoint(self, model, method) -> str:
+        """Return the (cached) URL for a model method such as `generateContent`."""
+        url = self._url_cache.get((model, method))
+        if url is None:
+            url = f"{GEMINI_API_BASE}/models/{model}:{method}"
+            self._url_cache[(model, method)] = url
+        return url
+
+    def _translate_tools(self, tools) -> List[Dict[str, Any]]:
+        """Translate OpenAI-style tools once per tools list."""
+        return self._tools_entry(tools)[1]
+
+    def _tool_validators(self, tools) -> Optional[Dict[str, Any]]:
+        """Return the argument validators for this request's tools, by name."""
+        if not tools:
+            return None
+        return self._tools_entry(tools)[2]
+
+    def _tools_entry(self, tools):
+        """Return the cached (tools, declarations, validators) for a tools list.
+
+        The tool runner passes the same list object on every turn, so cache by
+        identity. The list itself is kept in the entry so its id cannot be
+        reused by another object while cached.
+        """
+        entry = self._tools_cache.get(id(tools))
+        if entry is not None and entry[0] is tools:
+            return entry
+
+        translated = [
+            {"functionDeclarations": [_translate_tool(tool) for tool in tools]}
+        ]
+        validators = {}
+        if fastjsonschema is not None:
+            for tool in tools:
+                validator = self._compile_validator(tool["function"])
+                if validator is not None:
+                    validators[tool["function"]["name"]] = validator
+        if len(self._tools_cache) >= TOOLS_CACHE_SIZE:
+            self._tools_cache.clear()
+        entry = (tools, translated, validators)
+        self._tools_cache[id(tools)] = entry
+        return entry
+
+    def _compile_validator(self, function):
+        """Generate a specialised argument validator once per parameter schema.
+
+        Keyed by the schema rather than the tool name, so a tool redefined
+        under the same name gets a validator for its new parameters.
+        """
+        schema = function.get("parameters", {"type": "object"})
+        key = _json_dumps(schema, sort_keys=True)
+        if key in self._validators:
+            return self._validators[key]
+        try:
+            validator = fastjsonschema.compile(schema)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            # Leave tools with schemas fastjsonschema cannot compile unchecked.
+            validator = None
+        if len(self._validators) >= VALIDATORS_CACHE_SIZE:
+            self._validators.clear()
+        self._validators[key] = validator
+        return validator
+
+    def _rest_chat_completions_create(self, model, messages, **kwargs):
+        """Request chat completions by posting directly to the Gemini REST API."""
+        request_data = self._build_rest_request(messages, **kwargs)
+        if self._context_cache is not None:
+            self._context_cache.apply(model, request_data)
+
+        if ENABLE_DEBUG_MESSAGES:
+            print("Dumping the request data")
+            print(f"Request data: {request_data}")
+
+        url = self._endpoint(model, "generateContent")
+        try:
+            response = self._session.post(
+                url,
+                data=_json_dumps(request_data),
+                headers=JSON_HEADERS,
+                params=self._params,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise ValueError(f"Failed to call Google Gemini REST API: {e}")
+
+        return self.rest_transformer.convert_response(
+            _json_loads(response.content),
+            self._tool_validators(kwargs.get("tools")),
+        )
+
+    def chat_completions_stream(
+        self, model, messages, **kwargs
+    ) -> Iterator[ChatCompletionChunk]:
+        """Stream chat completions as they are generated.
+
+        With the `genai` transport chunks arrive over the client's gRPC
+        stream; with `rest` they are read as server-sent events from the
+        `streamGenerateContent` endpoint. Either way the first tokens are
+        available before generation finishes.
+        """
+        if self.transport == "genai":
+            return self._genai_chat_completions_stream(model, messages, **kwargs)
+        return self._rest_chat_completions_stream(model, messages, **kwargs)
+
+    def _rest_chat_completions_stream(
+        self, model, messages, **kwargs
+    ) -> Iterator[ChatCompletionChunk]:
+        request_data = self._build_rest_request(messages, **kwargs)
+        if self._context_cache is not None:
+            self._context_cache.apply(model, request_data)
+
+        url = self._endpoint(model, "streamGenerateContent")
+        try:
+            response = self._session.post(
+                url,
+                data=_json_dumps(request_data),
+                headers=JSON_HEADERS,
+                params=self._stream_params,
+                timeout=self.timeout,
+                stream=True,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise ValueError(f"Failed to call Google Gemini REST API: {e}")
+
+        # chunk_size=None hands over each event as soon as it is read instead
+        # of blocking until a fixed-size buffer fills.
+        with response:
+            for line in response.iter_lines(chunk_size=None):
+                if not line.startswith(b"data:"):
+                    continue
+                yield self.rest_transformer.convert_stream_chunk(
+                    _json_loads(line[len(b"data:") :]),
+                    self._tool_validators(kwargs.get("tools")),
+                )
+
+    def _new_aclient(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        """Return the async client for the running loop, replacing a stale one.
+
+        Pooled connections belong to the loop that opened them, so a client
+        left over from an earlier `asyncio.run` cannot be reused.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = self._new_aclient()
+            self._aclient_loop = loop
+        return self._aclient
+
+    async def _arequest(self, client, model, messages, **kwargs):
+        request_data = self._build_rest_request(messages, **kwargs)
+        if self._context_cache is not None:
+            # May create a cachedContent over the blocking session.
+            await asyncio.to_thread(self._context_cache.apply, model, request_data)
+        url = self._endpoint(model, "generateContent")
+        try:
+            response = await client.post(
+                url,
+                content=_json_dumps(request_data),
+                headers=JSON_HEADERS,
+                params=self._params,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise ValueError(f"Failed to call Google Gemini REST API: {e}")
+
+        return self.rest_transformer.convert_response(
+            _json_loads(response.content),
+            self._tool_validators(kwargs.get("tools")),
+        )
+
+    async def achat_completions_create(self, model, messages, **kwargs):
+        """Asynchronously request chat completions from Google Gemini.
+
+        With the `rest` transport and no micro-batcher, requests share the
+        async HTTP client. Otherwise the synchronous path runs in a worker
+        thread so the configured transport and batching still apply. Either
+        way the response cache is consulted.
+        """
+        if self.transport != "rest" or self._batcher is not None:
+            return await asyncio.to_thread(
+                self.chat_completions_create, model, messages, **kwargs
+            )
+
+        cache_key = self._response_cache_key(model, messages, kwargs)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        response = await self._arequest(self._get_aclient(), model, messages, **kwargs)
+
+        if cache_key is not None:
+            self._response_cache.put(cache_key, copy.deepcopy(response))
+        return response
+
+    def chat_completions_batch(self, model, list_of_messages, **kwargs):
+        """Run independent chat completions concurrently.
+
+        Args:
+        ----
+            model (str): The model name (e.g., "gemini-2.5-flash").
+            list_of_messages (list of list of dict): One chat history per request.
+            kwargs (dict): Optional arguments applied to every request.
+
+        Returns:
+        -------
+            A list of ChatCompletionResponse, in the same order as the input.
+        """
+
+        async def _gather():
+            try:
+                return await asyncio.gather(
+                    *[
+                        self.achat_completions_create(model, messages, **kwargs)
+                        for messages in list_of_messages
+                    ]
+                )
+            finally:
+                await self.aclose()
+
+        return list(asyncio.run(_gather()))
+
+    def chat_completions_create_many(self, models, messages, **kwargs):
+        """Send the same chat history to several models concurrently.
+
+        Requests run on a small thread pool and share the pooled session, so
+        total latency is bounded by the slowest model rather than the sum.
+
+        Args:
+        ----
+            models (list of str): Model names (e.g., "gemini-2.5-flash").
+            messages (list of dict): The chat history sent to every model.
+            kwargs (dict): Optional arguments applied to every request.
+
+        Returns:
+        -------
+            A list of ChatCompletionResponse, in the same order as `models`.
+        """
+        if not models:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(MAX_FANOUT_WORKERS, len(models))
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda model: self.chat_completions_create(
+                        model, messages, **kwargs
+                    ),
+                    models,
+                )
+            )
+
 
 class GoogleRestAudio(Audio):
     """Google REST API Audio functionality container."""
@@ -0,0 +1,126 @@
+"""
+On-disk response cache for the example scripts.
+
+Replays identical chat completion requests from a local SQLite database so
+reruns of the examples do not pay for the same round-trips again. Enable it
+with AISUITE_TEST_CACHE=1; entries expire after AISUITE_TEST_CACHE_TTL
+seconds (default: one day).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from aisuite.framework import ChatCompletionResponse, Message
+
+CACHE_PATH = os.path.join(os.path.dirname(__file__), ".llm_cache.sqlite")
+DEFAULT_TTL = 24 * 60 * 60
+
+
+def _json_default(obj):
+    """Serialize pydantic messages by their fields and anything else by repr."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    return repr(obj)
+
+
+class LLMCache:
+    """SQLite-backed cache of chat completion messages."""
+
+    def __init__(self, path=CACHE_PATH, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, response BLOB, ts INTEGER)"
+        )
+        self.db.commit()
+
+    @staticmethod
+    def cache_key(**kwargs):
+        """Hash every argument of a request, since any of them can change it."""
+        tools = kwargs.get("tools")
+        if tools is not None and callable(getattr(tools, "tools", None)):
+            # Identify a Tools registry by its public specs
+            kwargs["tools"] = tools.tools()
+        return hashlib.sha256(
+            json.dumps(kwargs, sort_keys=True, default=_json_default).encode()
+        ).hexdigest()
+
+    def get(self, key):
+        """Return the cached response for `key`, or None if absent or stale."""
+        row = self.db.execute(
+            "SELECT response, ts FROM cache WHERE key=?", (key,)
+        ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        data = json.loads(row[0])
+        response = ChatCompletionResponse()
+        response.choices[0].message = Message.model_validate(data["message"])
+        response.choices[0].finish_reason = data["finish_reason"]
+        return response
+
+    def put(self, key, response):
+        """Store the first choice of `response` under `key`."""
+        choice = response.choices[0]
+        data = {
+            "message": choice.message.model_dump(mode="json"),
+            "finish_reason": choice.finish_reason,
+        }
+        self.db.execute(
+            "INSERT OR REPLACE INTO cache (key, response, ts) VALUES (?, ?, ?)",
+            (key, json.dumps(data), int(time.time())),
+        )
+        self.db.commit()
+
+
+_CACHE = None
+
+
+def get_cache():
+    """Return the shared cache, or None unless AISUITE_TEST_CACHE=1."""
+    global _CACHE
+    if os.getenv("AISUITE_TEST_CACHE") != "1":
+        return None
+    if _CACHE is None:
+        _CACHE = LLMCache(ttl=int(os.getenv("AISUITE_TEST_CACHE_TTL", DEFAULT_TTL)))
+    return _CACHE
+
+
+async def cached_create(client, **kwargs):
+    """Call `client.chat.completions.create`, replaying cached responses."""
+    cache = get_cache()
+    if cache is None:
+        return await client.chat.completions.create(**kwargs)
+
+    key = LLMCache.cache_key(**kwargs)
+    response = cache.get(key)
+    if response is None:
+        response = await client.chat.completions.create(**kwargs)
+        cache.put(key, response)
+    return response
+
+
+async def cached_stream_text(client, **kwargs):
+    """Stream a completion and return its text, replaying cached text."""
+    cache = get_cache()
+    key = None
+    if cache is not None:
+        key = LLMCache.cache_key(stream=True, **kwargs)
+        response = cache.get(key)
+        if response is not None:
+            return response.choices[0].message.content
+
+    parts = []
+    async for chunk in await client.chat.completions.create(stream=True, **kwargs):
+        parts.append(chunk.choices[0].delta.content or "")
+    text = "".join(parts)
+
+    if cache is not None:
+        response = ChatCompletionResponse()
+        response.choices[0].message = Message(role="assistant", content=text)
+        response.choices[0].finish_reason = "stop"
+        cache.put(key, response)
+    return text
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from aisuite import AsyncClient
+
+
+@pytest.mark.asyncio
+@patch("aisuite.provider.ProviderFactory.create_provider")
+async def test_async_client_runs_requests_concurrently(mock_create_provider):
+    # Each call waits until the other one has started, so they only finish
+    # if both are in flight at once.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def create(model, messages, **kwargs):
+        barrier.wait()
+        return f"{model}:{kwargs['temperature']}"
+
+    mock_provider = Mock(spec=["chat_completions_create"])
+    mock_provider.chat_completions_create.side_effect = create
+    mock_create_provider.return_value = mock_provider
+
+    client = AsyncClient({"openai": {"api_key": "test_openai_api_key"}})
+    messages = [{"role": "user", "content": "Hello"}]
+
+    results = await asyncio.gather(
+        client.chat.completions.create(
+            "openai:gpt-4o", messages=messages, temperature=0.1
+        ),
+        client.chat.completions.create(
+            model="openai:gpt-4o-mini", messages=messages, temperature=0.2
+        ),
+    )
+
+    assert results == ["gpt-4o:0.1", "gpt-4o-mini:0.2"]
+    assert mock_provider.chat_completions_create.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("aisuite.provider.ProviderFactory.create_provider")
+async def test_async_client_streams_chunks(mock_create_provider):
+    mock_provider = Mock(spec=["chat_completions_create"])
+    mock_provider.chat_completions_create.return_value = iter(["Hel", "lo"])
+    mock_create_provider.return_value = mock_provider
+
+    client = AsyncClient({"openai": {"api_key": "test_openai_api_key"}})
+    stream = await client.chat.completions.create(
+        "openai:gpt-4o", [{"role": "user", "content": "Hello"}], stream=True
+    )
+
+    assert [chunk async for chunk in stream] == ["Hel", "lo"]
+
+
+@pytest.mark.asyncio
+@patch("aisuite.provider.ProviderFactory.create_provider")
+async def test_async_client_awaits_native_async_providers(mock_create_provider):
+    mock_provider = Mock()
+    mock_provider.achat_completions_create = AsyncMock(return_value="async")
+    mock_provider.aclose = AsyncMock()
+    mock_create_provider.return_value = mock_provider
+
+    client = AsyncClient({"google_rest": {"api_key": "test-api-key"}})
+    messages = [{"role": "user", "content": "Hello"}]
+
+    result = await client.chat.completions.create(
+        "google_rest:gemini-2.5-flash", messages, temperature=0.5
+    )
+    await client.aclose()
+
+    assert result == "async"
+    mock_provider.achat_completions_create.assert_awaited_once_with(
+        "gemini-2.5-flash", messages, temperature=0.5
+    )
+    mock_provider.chat_completions_create.assert_not_called()
+    mock_provider.aclose.assert_awaited_once()
@@ -0,0 +1,926 @@
+"""Tests for the Google Gemini REST API provider."""
+
+import asyncio
+import gc
+import json
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from aisuite.framework.message import (
+    ChatCompletionMessageToolCall,
+    Function,
+    Message,
+)
+from aisuite.providers import google_rest_provider
+from aisuite.providers.aws_provider import BedrockMessageConverter
+from aisuite.providers.google_rest_provider import (
+    GEMINI_API_BASE,
+    GeminiRestMessageConverter,
+    GoogleRestMessageConverter,
+    GoogleRestProvider,
+    _MicroBatcher,
+    _estimate_tokens,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_api_key_env_var(monkeypatch):
+    """Fixture to set environment variables for tests."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-api-key")
+
+
+@pytest.fixture
+def rest_provider():
+    provider = GoogleRestProvider(transport="rest")
+    yield provider
+    provider.close()
+
+
+def _mock_http_response(response_data):
+    return MagicMock(
+        status_code=200,
+        content=json.dumps(response_data).encode(),
+        json=lambda: response_data,
+    )
+
+
+def _sent_body(call):
+    return json.loads(call.kwargs.get("data") or call.kwargs.get("content"))
+
+
+def test_missing_api_key(monkeypatch):
+    """Test that an error is raised if the API key is missing."""
+    monkeypatch.delenv("GOOGLE_API_KEY")
+    with pytest.raises(EnvironmentError):
+        GoogleRestProvider(transport="rest")
+
+
+def test_unsupported_transport():
+    with pytest.raises(ValueError):
+        GoogleRestProvider(transport="carrier-pigeon")
+
+
+def test_rest_session_uses_pooled_adapter(rest_provider):
+    adapter = rest_provider._session.get_adapter(GEMINI_API_BASE)
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.read == 0
+    assert 429 in adapter.max_retries.status_forcelist
+
+    cache_adapter = rest_provider._session.get_adapter(
+        f"{GEMINI_API_BASE}/cachedContents"
+    )
+    assert cache_adapter.max_retries.total == 0
+
+
+def test_rest_completion(rest_provider):
+    """Test that completions are posted through the pooled session."""
+    response_data = {
+        "candidates": [{"content": {"role": "model", "parts": [{"text": "Ahoy!"}]}}],
+        "usageMetadata": {
+            "promptTokenCount": 7,
+            "candidatesTokenCount": 2,
+            "totalTokenCount": 9,
+        },
+    }
+    messages = [
+        {"role": "system", "content": "Respond in Pirate English."},
+        {"role": "user", "content": "Hello"},
+    ]
+
+    with patch.object(
+        rest_provider._session,
+        "post",
+        return_value=_mock_http_response(response_data),
+    ) as mock_post:
+        response = rest_provider.chat_completions_create(
+            "gemini-2.5-flash", messages, temperature=0.2
+        )
+
+    mock_post.assert_called_once()
+    args, kwargs = mock_post.call_args
+    assert args[0] == f"{GEMINI_API_BASE}/models/gemini-2.5-flash:generateContent"
+    assert kwargs["params"] == {"key": "test-api-key"}
+    assert kwargs["timeout"] == 30
+    body = _sent_body(mock_post.call_args)
+    assert kwargs["headers"] == {"Content-Type": "application/json"}
+    assert body["contents"] == [{"role": "user", "parts": [{"text": "Hello"}]}]
+    assert body["systemInstruction"] == {
+        "parts": [{"text": "Respond in Pirate English."}]
+    }
+    assert body["generationConfig"]["temperature"] == 0.2
+
+    assert response.choices[0].message.content == "Ahoy!"
+    assert response.choices[0].finish_reason == "stop"
+    assert response.usage.total_tokens == 9
+
+
+def test_rest_completion_with_tools(rest_provider):
+    tools = [
+        {
+            "type": "function",
+            "function": {
+                "name": "get_weather",
+                "description": "Get weather for a location.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "location": {"type": "string", "description": "City"}
+                    },
+                    "required": ["location"],
+                },
+            },
+        }
+    ]
+    response_data = {
+        "candidates": [
+            {
+                "content": {
+                    "role": "model",
+                    "parts": [
+                        {
+                            "functionCall": {
+                                "name": "get_weather",
+                                "args": {"location": "Tokyo"},
+                            }
+                        }
+                    ],
+                }
+            }
+        ]
+    }
+
+    with patch.object(
+        rest_provider._session,
+        "post",
+        return_value=_mock_http_response(response_data),
+    ) as mock_post:
+        response = rest_provider.chat_completions_create(
+            "gemini-2.5-flash",
+            [{"role": "user", "content": "Weather in Tokyo?"}],
+            tools=tools,
+        )
+
+    request_tools = _sent_body(mock_post.call_args)["tools"]
+    declaration = request_tools[0]["functionDeclarations"][0]
+    assert declaration["name"] == "get_weather"
+    assert declaration["parameters"]["required"] == ["location"]
+
+    tool_call = response.choices[0].message.tool_calls[0]
+    assert response.choices[0].finish_reason == "tool_calls"
+    assert tool_call.function.name == "get_weather"
+    assert json.loads(tool_call.function.arguments) == {"location": "Tokyo"}
+
+
+def test_rest_tool_translation_keeps_nested_schemas():
+    tool = {
+        "type": "function",
+        "function": {
+            "name": "add_tags",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "tags": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": ["a", "b"]},
+                    },
+                    "owner": {
+                        "type": "object",
+                        "properties": {
+                            "email": {"type": "string", "format": "email"}
+                        },
+                        "required": ["email"],
+                        "additionalProperties": False,
+                    },
+                },
+                "required": ["tags"],
+                "additionalProperties": False,
+                "$schema": "http://json-schema.org/draft-07/schema#",
+            },
+        },
+    }
+
+    parameters = google_rest_provider._translate_tool(tool)["parameters"]
+
+    assert parameters["properties"]["tags"] == {
+        "type": "array",
+        "items": {"type": "string", "enum": ["a", "b"]},
+        "description": "",
+    }
+    assert parameters["properties"]["owner"] == {
+        "type": "object",
+        "properties": {"email": {"type": "string", "format": "email"}},
+        "required": ["email"],
+        "description": "",
+    }
+    assert parameters["required"] == ["tags"]
+    assert "additionalProperties" not in parameters
+
+
+def test_rest_converter_tool_round_trip():
+    messages = [
+        {"role": "user", "content": "Weather in Tokyo?"},
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {
+                        "name": "get_weather",
+                        "arguments": '{"location": "Tokyo"}',
+                    },
+                }
+            ],
+        },
+        {
+            "role": "tool",
+            "name": "get_weather",
+            "tool_call_id": "call_1",
+            "content": '{"forecast": "sunny"}',
+        },
+    ]
+
+    contents, system_instruction = GeminiRestMessageConverter.convert_request(messages)
+
+    assert system_instruction is None
+    assert contents[1] == {
+        "role": "model",
+        "parts": [
+            {"functionCall": {"name": "get_weather", "args": {"location": "Tokyo"}}}
+        ],
+    }
+    assert contents[2]["parts"][0]["functionResponse"] == {
+        "name": "get_weather",
+        "response": {"forecast": "sunny"},
+    }
+
+
+def test_rest_tool_call_arguments_stay_openai_compatible():
+    call = {"functionCall": {"name": "get_weather", "args": {"location": "Tokyo"}}}
+    response = GeminiRestMessageConverter.convert_response(
+        {"candidates": [{"content": {"parts": [call]}}]}
+    )
+    message = response.choices[0].message
+    arguments = message.tool_calls[0].function.arguments
+
+    assert isinstance(arguments, str)
+    assert message.model_dump()["tool_calls"][0]["function"]["arguments"] == arguments
+
+    # Replaying the assistant turn reuses the parsed dict instead of decoding it.
+    contents, _ = GeminiRestMessageConverter.convert_request([message])
+    args = contents[0]["parts"][0]["functionCall"]["args"]
+    assert args == {"location": "Tokyo"}
+    assert args is call["functionCall"]["args"]
+
+    # Other providers' converters still receive a JSON string.
+    _, bedrock_messages = BedrockMessageConverter.convert_request([message])
+    tool_use = bedrock_messages[0]["content"][0]["toolUse"]
+    assert tool_use["input"] == {"location": "Tokyo"}
+
+
+@pytest.mark.asyncio
+async def test_async_completion(rest_provider):
+    response_data = {"candidates": [{"content": {"parts": [{"text": "Hello!"}]}}]}
+    mock_response = _mock_http_response(response_data)
+
+    with patch(
+        "httpx.AsyncClient.post", new=AsyncMock(return_value=mock_response)
+    ) as mock_post:
+        response = await rest_provider.achat_completions_create(
+            "gemini-2.5-flash", [{"role": "user", "content": "Hi"}]
+        )
+    await rest_provider.aclose()
+
+    args, kwargs = mock_post.call_args
+    assert args[0] == f"{GEMINI_API_BASE}/models/gemini-2.5-flash:generateContent"
+    assert kwargs["params"] == {"key": "test-api-key"}
+    assert response.choices[0].message.content == "Hello!"
+
+
+@pytest.mark.asyncio
+async def test_async_completion_uses_response_cache(rest_provider):
+    response_data = {"candidates": [{"content": {"parts": [{"text": "Hello!"}]}}]}
+    messages = [{"role": "user", "content": "Hi"}]
+
+    with patch(
+        "httpx.AsyncClient.post",
+        new=AsyncMock(return_value=_mock_http_response(response_data)),
+    ) as mock_post:
+        for _ in range(2):
+            await rest_provider.achat_completions_create(
+                "gemini-2.5-flash", messages, temperature=0
+            )
+    await rest_provider.aclose()
+
+    assert mock_post.await_count == 1
+    assert rest_provider.cache_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_completion_honors_genai_transport():
+    provider = GoogleRestProvider(transport="genai")
+    provider._genai = MagicMock()
+    provider._genai.GenerativeModel.return_value.generate_content.return_value = (
+        MagicMock(text="Hello")
+    )
+
+    with patch("httpx.AsyncClient.post", new=AsyncMock()) as mock_post:
+        await provider.achat_completions_create(
+            "gemini-2.5-flash", [{"role": "user", "content": "Hi"}]
+        )
+
+    mock_post.assert_not_awaited()
+    provider._genai.GenerativeModel.return_value.generate_content.assert_called_once()
+
+
+class _GeminiStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps(
+            {"candidates": [{"content": {"parts": [{"text": "Hello!"}]}}]}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_async_completion_across_event_loops(rest_provider, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GeminiStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        google_rest_provider,
+        "GEMINI_API_BASE",
+        f"http://127.0.0.1:{server.server_address[1]}",
+    )
+    messages = [{"role": "user", "content": "Hi"}]
+
+    try:
+        # Each asyncio.run closes its loop, along with any keep-alive sockets
+        # the provider's async client opened on it.
+        for _ in range(2):
+            response = asyncio.run(
+                rest_provider.achat_completions_create("gemini-2.5-flash", messages)
+            )
+            assert response.choices[0].message.content == "Hello!"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_batch_completion_preserves_order(rest_provider):
+    async def fake_post(url, content, headers, params):
+        text = json.loads(content)["contents"][0]["parts"][0]["text"]
+        response_data = {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+        return _mock_http_response(response_data)
+
+    with patch("httpx.AsyncClient.post", new=AsyncMock(side_effect=fake_post)):
+        responses = rest_provider.chat_completions_batch(
+            "gemini-2.5-flash",
+            [
+                [{"role": "user", "content": "first"}],
+                [{"role": "user", "content": "second"}],
+            ],
+        )
+
+    assert [r.choices[0].message.content for r in responses] == ["first", "second"]
+    assert rest_provider._aclient is None
+
+
+def test_micro_batching_coalesces_concurrent_calls():
+    provider = GoogleRestProvider(transport="rest", batch_window_ms=200, max_batch=3)
+    batch_sizes = []
+    original_dispatch = _MicroBatcher._dispatch
+
+    async def spy_dispatch(self, client, batch):
+        batch_sizes.append(len(batch))
+        await original_dispatch(self, client, batch)
+
+    async def fake_post(url, content, headers, params):
+        text = json.loads(content)["contents"][0]["parts"][0]["text"]
+        response_data = {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+        return _mock_http_response(response_data)
+
+    prompts = ["one", "two", "three"]
+    with patch.object(_MicroBatcher, "_dispatch", spy_dispatch), patch(
+        "httpx.AsyncClient.post", new=AsyncMock(side_effect=fake_post)
+    ):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            responses = list(
+                executor.map(
+                    lambda prompt: provider.chat_completions_create(
+                        "gemini-2.5-flash", [{"role": "user", "content": prompt}]
+                    ),
+                    prompts,
+                )
+            )
+        provider.close()
+
+    assert [r.choices[0].message.content for r in responses] == prompts
+    assert batch_sizes == [3]
+
+
+def test_deterministic_requests_are_cached(rest_provider):
+    response_data = {"candidates": [{"content": {"parts": [{"text": "Hi"}]}}]}
+    messages = [{"role": "user", "content": "Say hi"}]
+
+    with patch.object(
+        rest_provider._session,
+        "post",
+        return_value=_mock_http_response(response_data),
+    ) as mock_post:
+        first = rest_provider.chat_completions_create(
+            "gemini-2.5-flash", messages, temperature=0
+        )
+        second = rest_provider.chat_completions_create(
+            "gemini-2.5-flash", messages, temperature=0
+        )
+        rest_provider.chat_completions_create(
+            "gemini-2.5-flash", messages, temperature=0.7
+        )
+
+    assert mock_post.call_count == 2
+    assert second.choices[0].message.content == "Hi"
+    assert second is not first
+    assert rest_provider.cache_stats()["hits"] == 1
+    assert rest_provider.cache_stats()["misses"] == 1
+
+
+def test_context_cache_reuses_long_prefix():
+    provider = GoogleRestProvider(
+        transport="rest", context_cache=True, context_cache_min_tokens=1
+    )
+    generate_response = {"candidates": [{"content": {"parts": [{"text": "Sure"}]}}]}
+
+    def fake_post(url, data, headers, params, timeout):
+        if url.endswith("/cachedContents"):
+            return _mock_http_response({"name": "cachedContents/abc123"})
+        return _mock_http_response(generate_response)
+
+    messages = [
+        {"role": "system", "content": "You are a helpful coding assistant."},
+        {"role": "user", "content": "What is Python?"},
+        {"role": "assistant", "content": "A programming language."},
+        {"role": "user", "content": "Give me an example."},
+    ]
+
+    with patch.object(provider._session, "post", side_effect=fake_post) as mock_post:
+        provider.chat_completions_create("gemini-2.5-flash", messages)
+        provider.chat_completions_create(
+            "gemini-2.5-flash",
+            messages
+            + [
+                {"role": "assistant", "content": "print('hi')"},
+                {"role": "user", "content": "Thanks"},
+            ],
+        )
+
+    urls = [call.args[0] for call in mock_post.call_args_list]
+    assert urls.count(f"{GEMINI_API_BASE}/cachedContents") == 1
+
+    cache_body = _sent_body(mock_post.call_args_list[0])
+    assert cache_body["model"] == "models/gemini-2.5-flash"
+    assert len(cache_body["contents"]) == 2
+    assert "systemInstruction" in cache_body
+
+    first_request = _sent_body(mock_post.call_args_list[1])
+    assert first_request["cachedContent"] == "cachedContents/abc123"
+    assert first_request["contents"] == [
+        {"role": "user", "parts": [{"text": "Give me an example."}]}
+    ]
+    assert "systemInstruction" not in first_request
+
+    second_request = _sent_body(mock_post.call_args_list[2])
+    assert second_request["cachedContent"] == "cachedContents/abc123"
+    assert len(second_request["contents"]) == 3
+    provider.close()
+
+
+def test_context_cache_creates_shared_prefix_once():
+    provider = GoogleRestProvider(
+        transport="rest", context_cache=True, context_cache_min_tokens=1
+    )
+    generate_response = {"candidates": [{"content": {"parts": [{"text": "Sure"}]}}]}
+    creating = threading.Event()
+    release = threading.Event()
+
+    def fake_post(url, data, headers, params, timeout):
+        if url.endswith("/cachedContents"):
+            creating.set()
+            release.wait(5)
+            return _mock_http_response({"name": "cachedContents/abc123"})
+        return _mock_http_response(generate_response)
+
+    messages = [
+        {"role": "user", "content": "What is Python?"},
+        {"role": "assistant", "content": "A programming language."},
+        {"role": "user", "content": "Give me an example."},
+    ]
+
+    with patch.object(provider._session, "post", side_effect=fake_post) as mock_post:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(
+                provider.chat_completions_create, "gemini-2.5-flash", messages
+            )
+            assert creating.wait(5)
+            second = executor.submit(
+                provider.chat_completions_create, "gemini-2.5-flash", messages
+            )
+            # Give the second caller time to find the create in flight
+            time.sleep(0.05)
+            release.set()
+            first.result(timeout=5)
+            second.result(timeout=5)
+
+    urls = [call.args[0] for call in mock_post.call_args_list]
+    assert urls.count(f"{GEMINI_API_BASE}/cachedContents") == 1
+    for call in mock_post.call_args_list[1:]:
+        assert _sent_body(call)["cachedContent"] == "cachedContents/abc123"
+    provider.close()
+
+
+def test_streaming_completion(rest_provider):
+    events = [
+        b'data: {"candidates": [{"content": {"parts": [{"text": "Hel"}]}}]}',
+        b"",
+        b'data: {"candidates": [{"content": {"parts": [{"text": "lo"}]}, '
+        b'"finishReason": "STOP"}], "usageMetadata": {"totalTokenCount": 5}}',
+    ]
+    mock_response = MagicMock()
+    mock_response.iter_lines.return_value = iter(events)
+    mock_response.__enter__.return_value = mock_response
+
+    with patch.object(
+        rest_provider._session, "post", return_value=mock_response
+    ) as mock_post:
+        chunks = list(
+            rest_provider.chat_completions_create(
+                "gemini-2.5-flash",
+                [{"role": "user", "content": "Hi"}],
+                stream=True,
+            )
+        )
+
+    args, kwargs = mock_post.call_args
+    assert args[0].endswith("/models/gemini-2.5-flash:streamGenerateContent")
+    assert kwargs["params"] == {"key": "test-api-key", "alt": "sse"}
+    assert kwargs["stream"] is True
+    mock_response.iter_lines.assert_called_once_with(chunk_size=None)
+    assert "".join(c.choices[0].delta.content for c in chunks) == "Hello"
+    assert chunks[0].choices[0].finish_reason is None
+    assert chunks[-1].choices[0].finish_reason == "stop"
+    assert chunks[-1].usage.total_tokens == 5
+
+
+def test_json_helpers_fall_back_without_orjson(monkeypatch):
+    monkeypatch.setattr(google_rest_provider, "orjson", None)
+
+    payload = {"contents": [{"parts": [{"text": "héllo"}]}]}
+    encoded = google_rest_provider._json_dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert google_rest_provider._json_loads(encoded) == payload
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_dumps_rejects_unknown_types(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(google_rest_provider, "orjson", None)
+    elif google_rest_provider.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    with pytest.raises(TypeError):
+        google_rest_provider._json_dumps({"args": object()})
+
+
+def test_rest_converter_accepts_message_objects():
+    assistant = Message(
+        role="assistant",
+        content=None,
+        tool_calls=[
+            ChatCompletionMessageToolCall(
+                id="call_1",
+                type="function",
+                function=Function(name="get_time", arguments="{}"),
+            )
+        ],
+    )
+
+    contents, _ = GeminiRestMessageConverter.convert_request(
+        [{"role": "user", "content": "What time is it?"}, assistant]
+    )
+
+    assert contents[1] == {
+        "role": "model",
+        "parts": [{"functionCall": {"name": "get_time", "args": {}}}],
+    }
+
+
+def test_genai_converter_flattens_history():
+    messages = [
+        {"role": "system", "content": "Be brief."},
+        {"role": "user", "content": "What is Python?"},
+        {"role": "assistant", "content": "A language."},
+        {"role": "tool", "content": '{"ok": true}'},
+        {"role": "user", "content": "Example?"},
+    ]
+
+    contents, system_instruction = GoogleRestMessageConverter.convert_request(messages)
+
+    assert system_instruction == "Be brief."
+    assert contents == (
+        "User: What is Python?\n\nAssistant: A language.\n\n"
+        'Tool Response: {"ok": true}\n\nUser: Example?'
+    )
+
+
+def test_rest_converter_assigns_distinct_tool_call_ids():
+    call = {"functionCall": {"name": "get_weather", "args": {"location": "Paris"}}}
+    response_data = {"candidates": [{"content": {"parts": [call, call]}}]}
+
+    response = GeminiRestMessageConverter.convert_response(response_data)
+
+    ids = [tool_call.id for tool_call in response.choices[0].message.tool_calls]
+    assert len(set(ids)) == 2
+    assert all(id.startswith("call_") for id in ids)
+
+
+def test_genai_models_and_configs_are_reused():
+    provider = GoogleRestProvider()
+    provider._genai = MagicMock()
+    provider._genai.GenerativeModel.return_value.generate_content.return_value = (
+        MagicMock(text="Hello")
+    )
+    messages = [{"role": "user", "content": "Hi"}]
+
+    provider.chat_completions_create("gemini-2.5-flash", messages, temperature=0.5)
+    provider.chat_completions_create("gemini-2.5-flash", messages, temperature=0.5)
+    provider.chat_completions_create("gemini-2.5-flash", messages, temperature=0.9)
+
+    provider._genai.GenerativeModel.assert_called_once_with("gemini-2.5-flash")
+    assert provider._genai.GenerationConfig.call_count == 2
+
+
+def test_rest_tool_translation_is_cached_per_tools_list(rest_provider):
+    tools = [
+        {
+            "type": "function",
+            "function": {
+                "name": "get_time",
+                "description": "Get current time.",
+                "parameters": {"type": "object", "properties": {}},
+            },
+        }
+    ]
+
+    first = rest_provider._build_rest_request([], tools=tools)["tools"]
+    second = rest_provider._build_rest_request([], tools=tools)["tools"]
+    other = rest_provider._build_rest_request([], tools=list(tools))["tools"]
+
+    assert first is second
+    assert other is not first
+    assert other == first
+
+
+def test_genai_is_imported_lazily():
+    provider = GoogleRestProvider()
+    assert provider._genai is None
+
+    with patch("google.generativeai.configure") as mock_configure:
+        genai = provider._ensure_genai()
+        assert provider._ensure_genai() is genai
+
+    mock_configure.assert_called_once_with(api_key="test-api-key", transport="grpc")
+
+
+def test_transport_falls_back_to_rest_without_genai():
+    with patch(
+        "aisuite.providers.google_rest_provider._genai_available", return_value=False
+    ):
+        provider = GoogleRestProvider()
+
+    assert provider.transport == "rest"
+
+
+def test_genai_streaming_uses_grpc_stream():
+    provider = GoogleRestProvider(transport="genai")
+    provider._genai = MagicMock()
+    generate = provider._genai.GenerativeModel.return_value.generate_content
+
+    def chunk(*texts):
+        parts = [SimpleNamespace(text=text) for text in texts]
+        candidates = [SimpleNamespace(content=SimpleNamespace(parts=parts))]
+        return SimpleNamespace(candidates=candidates if texts else [])
+
+    # A function-call part has no text, and the final chunk has no candidates.
+    generate.return_value = iter([chunk("Hel"), chunk("lo"), chunk(""), chunk()])
+
+    chunks = list(
+        provider.chat_completions_create(
+            "gemini-2.5-flash", [{"role": "user", "content": "Hi"}], stream=True
+        )
+    )
+
+    assert generate.call_args.kwargs["stream"] is True
+    assert [c.choices[0].delta.content for c in chunks[:-1]] == [
+        "Hel",
+        "lo",
+        None,
+        None,
+    ]
+    assert chunks[-1].choices[0].finish_reason == "stop"
+
+
+def test_rest_tool_arguments_are_validated(rest_provider):
+    pytest.importorskip("fastjsonschema")
+    tools = [
+        {
+            "type": "function",
+            "function": {
+                "name": "get_weather",
+                "parameters": {
+                    "type": "object",
+                    "properties": {"location": {"type": "string"}},
+                    "required": ["location"],
+                },
+            },
+        }
+    ]
+    bad_call = {"functionCall": {"name": "get_weather", "args": {"city": "Paris"}}}
+    response_data = {"candidates": [{"content": {"parts": [bad_call]}}]}
+
+    with patch.object(
+        rest_provider._session,
+        "post",
+        return_value=_mock_http_response(response_data),
+    ):
+        with pytest.raises(ValueError, match="Invalid arguments for tool"):
+            rest_provider.chat_completions_create(
+                "gemini-2.5-flash",
+                [{"role": "user", "content": "Weather?"}],
+                tools=tools,
+            )
+
+
+def test_redefined_tool_gets_a_new_validator(rest_provider):
+    pytest.importorskip("fastjsonschema")
+
+    def tools_with(properties):
+        return [
+            {
+                "type": "function",
+                "function": {
+                    "name": "f",
+                    "parameters": {
+                        "type": "object",
+                        "properties": properties,
+                        "required": list(properties),
+                    },
+                },
+            }
+        ]
+
+    call = {"functionCall": {"name": "f", "args": {"b": 3}}}
+    response_data = {"candidates": [{"content": {"parts": [call]}}]}
+    messages = [{"role": "user", "content": "Call f"}]
+
+    with patch.object(
+        rest_provider._session,
+        "post",
+        return_value=_mock_http_response(response_data),
+    ):
+        with pytest.raises(ValueError, match="Invalid arguments for tool"):
+            rest_provider.chat_completions_create(
+                "gemini-2.5-flash",
+                messages,
+                tools=tools_with({"a": {"type": "string"}}),
+            )
+        response = rest_provider.chat_completions_create(
+            "gemini-2.5-flash", messages, tools=tools_with({"b": {"type": "integer"}})
+        )
+
+    assert json.loads(response.choices[0].message.tool_calls[0].function.arguments) == {
+        "b": 3
+    }
+
+
+def test_cache_key_serializes_message_objects(rest_provider):
+    def key_for(messages):
+        return rest_provider._response_cache_key(
+            "gemini-2.5-flash", messages, {"temperature": 0}
+        )
+
+    first = key_for([Message(role="user", content="Hi")])
+
+    assert first is not None
+    assert first == key_for([Message(role="user", content="Hi")])
+    assert first != key_for([Message(role="user", content="Bye")])
+
+
+def test_token_estimate_stops_at_limit():
+    contents = [{"parts": [{"text": "a" * 40}]}, {"parts": [{"text": "b" * 400}]}]
+
+    assert _estimate_tokens(None, contents) == 110
+    assert _estimate_tokens(None, contents, limit=5) == 10
+
+
+def test_create_many_fans_out_across_models(rest_provider):
+    def respond(url, **kwargs):
+        model = url.rsplit("/", 1)[-1].split(":")[0]
+        return _mock_http_response(
+            {"candidates": [{"content": {"parts": [{"text": model}]}}]}
+        )
+
+    models = ["gemini-1.5-flash", "gemini-1.5-pro", "gemini-2.5-flash"]
+    with patch.object(rest_provider._session, "post", side_effect=respond):
+        responses = rest_provider.chat_completions_create_many(
+            models, [{"role": "user", "content": "Hi"}], temperature=0.5
+        )
+
+    assert [r.choices[0].message.content for r in responses] == models
+
+
+def test_temperature_none_is_not_cached(rest_provider):
+    response_data = {"candidates": [{"content": {"parts": [{"text": "Hi"}]}}]}
+    messages = [{"role": "user", "content": "Hi"}]
+
+    with patch.object(
+        rest_provider._session,
+        "post",
+        return_value=_mock_http_response(response_data),
+    ) as mock_post:
+        for _ in range(2):
+            rest_provider.chat_completions_create(
+                "gemini-2.5-flash", messages, temperature=None
+            )
+
+    assert mock_post.call_count == 2
+    assert rest_provider.cache_stats()["size"] == 0
+
+
+def test_micro_batcher_does_not_keep_provider_alive():
+    provider = GoogleRestProvider(transport="rest", batch_window_ms=10)
+    thread = provider._batcher._thread
+    provider_ref = weakref.ref(provider)
+
+    del provider
+    gc.collect()
+
+    assert provider_ref() is None
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_micro_batcher_rejects_calls_while_closing():
+    provider = GoogleRestProvider(transport="rest", batch_window_ms=10)
+    in_flight = threading.Event()
+    release = threading.Event()
+
+    async def slow_post(url, content, headers, params):
+        in_flight.set()
+        await asyncio.to_thread(release.wait, 5)
+        return _mock_http_response(
+            {"candidates": [{"content": {"parts": [{"text": "done"}]}}]}
+        )
+
+    messages = [{"role": "user", "content": "Hi"}]
+    with patch("httpx.AsyncClient.post", new=AsyncMock(side_effect=slow_post)):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            first = executor.submit(
+                provider.chat_completions_create, "gemini-2.5-flash", messages
+            )
+            assert in_flight.wait(5)
+            closing = executor.submit(provider.close)
+            while not provider._batcher._closed:
+                time.sleep(0.001)
+            late = executor.submit(
+                provider.chat_completions_create, "gemini-2.5-flash", messages
+            )
+            with pytest.raises(RuntimeError, match="closed"):
+                late.result(timeout=5)
+            release.set()
+            closing.result(timeout=5)
+
+    assert first.result().choices[0].message.content == "done"
+
+
+def test_micro_batching_requires_rest_transport():
+    with pytest.raises(ValueError, match="transport='rest'"):
+        GoogleRestProvider(transport="genai", batch_window_ms=10)